@@ -1,26 +1,39 @@
 """Minut Point API."""
 
+import asyncio
 import logging
-from threading import RLock
+from time import monotonic
 
 from aiohttp import ClientResponse
 from aiohttp.client_exceptions import ClientResponseError
 
 from .auth import AbstractAuth
 from .const import (
+    ALL_EVENTS,
+    EVENT_TO_CATEGORY,
     EVENTS,
     MAP_SENSORS,
     MINUT_DEVICES_URL,
     MINUT_HOMES_URL,
     MINUT_USER_URL,
     MINUT_WEBHOOKS_URL,
+    device_sensor_url,
+    device_url,
+    home_url,
+    hook_url,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_CACHE_MISS = object()
 
-class PointSession:  # pylint: disable=too-many-instance-attributes
-    """Point Session class used by the devices."""
+
+class PointSession:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Point Session class used by the devices.
+
+    The session is meant to be used from a single asyncio event loop;
+    state access therefore needs no thread lock.
+    """
 
     def __init__(
         self,
@@ -31,33 +44,142 @@ class PointSession:  # pylint: disable=too-many-instance-attributes
         self._user = None
         self._webhook = {}
         self._device_state = {}
+        self._state_version = 0
+        self._device_ids_view = None
+        self._devices = {}
+        self._battery = {}
+        self._last_heard = {}
+        self._descriptions = {}
         self._homes = {}
-        self._lock = RLock()
+        self._homes_filtered = {}
+        self._update_lock = asyncio.Lock()
+        self._last_update = 0.0
+        self._event_queue = None
+        self._event_task = None
+        self._inflight = {}
+        self._sensor_cache = {}
+        self._sensor_ttl = 30.0
+        self._hooks_cache = None
+        self._hooks_ttl = 60.0
+        self._hooks_etag = None
+        self._hooks_by_url = {}
+        self._list_cache = {}
+        self._url_cache = {}
 
     async def _request_devices(self, url, _type):
-        """Request list of devices."""
-        res = await self.auth.request(url)
-        return res.get(_type) if res else {}
+        """Request list of devices, using a conditional GET when possible."""
+        cached = self._list_cache.get(url)
+        items, etag = await self.auth.request_items(
+            url, _type, etag=cached[0] if cached else None
+        )
+        if items is None:  # 304 Not Modified
+            return cached[1]
+        if etag:
+            self._list_cache[url] = (etag, items)
+        return items
+
+    def _cached_sensor(self, device_id, sensor_uri):
+        """Return a cached sensor value, or _CACHE_MISS when absent.
+
+        Expects sensor_uri to be mapped through MAP_SENSORS already.
+        """
+        device = self._device_state.get(device_id)
+        values = device.get("latest_sensor_values") if device is not None else None
+        entry = values.get(sensor_uri) if values is not None else None
+        if entry is not None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Cached sensor value for %s: %s", sensor_uri, entry)
+            return entry["value"]
+        cached = self._sensor_cache.get((device_id, sensor_uri))
+        if cached is not None and monotonic() - cached[1] < self._sensor_ttl:
+            return cached[0]
+        return _CACHE_MISS
 
     async def read_sensor(self, device_id, sensor_uri):
         """Return sensor value based on sensor_uri."""
         sensor_uri = MAP_SENSORS.get(sensor_uri, sensor_uri)
-        if device_id in self._device_state and sensor_uri in self._device_state[
-            device_id
-        ].get("latest_sensor_values", {}):
-            _LOGGER.debug(
-                "Cached sensor value for %s: %s",
-                sensor_uri,
-                self._device_state[device_id]["latest_sensor_values"][sensor_uri],
+        value = self._cached_sensor(device_id, sensor_uri)
+        if value is not _CACHE_MISS:
+            return value
+        key = (device_id, sensor_uri)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            url = self._url_cache.get(key) or self._url_cache.setdefault(
+                key, device_sensor_url(device_id, sensor_uri)
             )
-            return self._device_state[device_id]["latest_sensor_values"][sensor_uri][
-                "value"
-            ]
-        url = MINUT_DEVICES_URL + f"/{device_id}/{sensor_uri}"
-        res = await self.auth.request(url, request_type="GET", data={"limit": 1})
-        if not res or not res.get("values"):
-            return None
-        return res.get("values")[-1].get("value")
+            res = await self.auth.request(url, request_type="GET", data={"limit": 1})
+            value = (
+                res.get("values")[-1].get("value")
+                if res and res.get("values")
+                else None
+            )
+            self._sensor_cache[key] = (value, monotonic())
+            future.set_result(value)
+            return value
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # Consumed here, waiters re-raise via await
+            raise
+        finally:
+            if not future.done():  # Cancelled leader, release the waiters
+                future.cancel()
+            del self._inflight[key]
+
+    def _index_device(self, device):
+        """Refresh the per-field lookups for one device dict."""
+        device_id = device["device_id"]
+        battery = device.get("battery")
+        self._battery[device_id] = battery.get("percent") if battery else None
+        self._last_heard[device_id] = device.get("last_heard_from_at")
+        self._descriptions[device_id] = device.get("description")
+
+    def battery_level(self, device_id):
+        """Return the battery level of a device."""
+        return self._battery.get(device_id)
+
+    def last_heard(self, device_id):
+        """Return when a device was last heard from."""
+        return self._last_heard.get(device_id)
+
+    def description(self, device_id):
+        """Return the description of a device."""
+        return self._descriptions.get(device_id)
+
+    async def prime_device(self, device_id):
+        """Refresh a single device so sensor reads hit the cache.
+
+        One GET populates latest_sensor_values for the device, turning a
+        cold fan-out of per-sensor requests into cache hits.
+        """
+        res = await self.auth.request(device_url(device_id))
+        if res:
+            self._device_state[device_id] = res
+            self._index_device(res)
+            self._state_version += 1
+        return res
+
+    async def read_sensors(self, specs):
+        """Read several (device_id, sensor_uri) pairs concurrently.
+
+        Cached values resolve without consuming a semaphore permit; the
+        rest fan out in parallel, bounded so the connection pool is not
+        oversaturated.
+        """
+        sem = asyncio.Semaphore(8)
+
+        async def _read(device_id, sensor_uri):
+            sensor_uri = MAP_SENSORS.get(sensor_uri, sensor_uri)
+            value = self._cached_sensor(device_id, sensor_uri)
+            if value is not _CACHE_MISS:
+                return value
+            async with sem:
+                return await self.read_sensor(device_id, sensor_uri)
+
+        return await asyncio.gather(*(_read(*spec) for spec in specs))
 
     async def user(self):
         """Update and returns the user data."""
@@ -78,72 +200,245 @@ class PointSession:  # pylint: disable=too-many-instance-attributes
     async def remove_webhook(self):
         """Remove webhook."""
         if self._webhook and self._webhook.get("hook_id"):
-            await self.auth.request(
-                f"{MINUT_WEBHOOKS_URL}/{self._webhook['hook_id']}",
+            res = await self.auth.request(
+                hook_url(self._webhook["hook_id"]),
                 request_type="DELETE",
             )
+            if res is not None:  # None means the request never went through
+                self._webhook = {}
+                self._hooks_cache = None
+                self._hooks_by_url = {}
+
+    async def _get_webhooks(self):
+        """Return the list of registered webhooks, cached for a short while."""
+        if (
+            self._hooks_cache is not None
+            and monotonic() - self._hooks_cache[0] < self._hooks_ttl
+        ):
+            return self._hooks_cache[1]
+        headers = None
+        if self._hooks_etag and self._hooks_cache is not None:
+            headers = {"If-None-Match": self._hooks_etag}
+        res, status, res_headers = await self.auth.request_with_headers(
+            MINUT_WEBHOOKS_URL, request_type="GET", headers=headers
+        )
+        if status == 304:  # Unchanged, reuse the cached list
+            hooks = self._hooks_cache[1]
+        elif res:
+            hooks = res["hooks"]
+            self._hooks_etag = res_headers.get("etag")
+        else:
+            return self._hooks_cache[1] if self._hooks_cache else []
+        self._hooks_cache = (monotonic(), hooks)
+        self._hooks_by_url = {hook["url"]: hook for hook in hooks}
+        return hooks
 
     async def update_webhook(
         self, webhook_url, webhook_id, events=None
     ) -> ClientResponse | None:
         """Register webhook (if it doesn't exit)."""
-        hooks = (await self.auth.request(MINUT_WEBHOOKS_URL, request_type="GET"))[
-            "hooks"
-        ]
-        try:
-            self._webhook = next(hook for hook in hooks if hook["url"] == webhook_url)
+        if self._webhook and self._webhook.get("url") == webhook_url:
             _LOGGER.debug("Webhook: %s, %s", self._webhook, webhook_id)
-        except StopIteration:  # Not found
-            if events is None:
-                events = [e for v in EVENTS.values() for e in v if e]
-            try:
-                self._webhook = await self._register_webhook(webhook_url, events)
-                _LOGGER.debug("Registered hook: %s", self._webhook)
-                return self._webhook
-            except ClientResponseError:
-                return None
+            return None
+        await self._get_webhooks()
+        hook = self._hooks_by_url.get(webhook_url)
+        if hook is not None:
+            self._webhook = hook
+            _LOGGER.debug("Webhook: %s, %s", self._webhook, webhook_id)
+            return None
+        if events is None:
+            events = list(ALL_EVENTS)
+        try:
+            self._webhook = await self._register_webhook(webhook_url, events)
+            _LOGGER.debug("Registered hook: %s", self._webhook)
+            self._hooks_by_url[webhook_url] = self._webhook
+            if self._hooks_cache is not None:
+                self._hooks_cache = (
+                    monotonic(),
+                    self._hooks_cache[1] + [self._webhook],
+                )
+            return self._webhook
+        except ClientResponseError:
+            return None
 
     @property
     def webhook(self):
         """Return the webhook id and secret."""
         return self._webhook.get("hook_id")
 
-    async def update(self):
-        """Update all devices from server."""
-        with self._lock:
-            devices = await self._request_devices(MINUT_DEVICES_URL, "devices")
+    async def update(self, max_age=0):
+        """Update all devices from server.
+
+        With a max_age, a refresh younger than that many seconds is
+        reused instead of re-polling, letting webhook-driven callers
+        keep update() as a cheap cold-start/refresh path.
+        """
+        async with self._update_lock:
+            if max_age and monotonic() - self._last_update < max_age:
+                return list(self._device_state.values())
+            devices = await self._update()
+            if devices:  # Failed polls should retry, not count as fresh
+                self._last_update = monotonic()
+            return devices
 
-            if devices:
-                self._device_state = {device["device_id"]: device for device in devices}
+    def start_event_batcher(self, handler, max_batch=50, flush_interval=0.25):
+        """Start a task that delivers queued webhook events in batches.
+
+        Events added with queue_webhook_event are merged into the device
+        state and handed to the async handler as one list per window,
+        amortizing downstream work across bursts.
+        """
+        if self._event_task is not None:
+            return
+        self._event_queue = asyncio.Queue()
+        self._event_task = asyncio.get_running_loop().create_task(
+            self._drain_events(handler, max_batch, flush_interval)
+        )
+
+    def queue_webhook_event(self, event_payload):
+        """Queue a webhook event for batched processing."""
+        if self._event_queue is None:
+            raise RuntimeError("Event batcher is not running")
+        self._event_queue.put_nowait(event_payload)
+
+    async def _drain_events(self, handler, max_batch, flush_interval):
+        """Collect queued events for a short window and hand them over."""
+        while True:
+            batch = [await self._event_queue.get()]
+            deadline = monotonic() + flush_interval
+            while len(batch) < max_batch:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._event_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            for event_payload in batch:
+                try:
+                    self.apply_webhook_event(event_payload)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    _LOGGER.exception("Failed to apply event: %s", event_payload)
+            try:
+                await handler(batch)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _LOGGER.exception("Event batch handler failed")
+
+    async def stop_event_batcher(self):
+        """Stop the event batcher task."""
+        if self._event_task is None:
+            return
+        self._event_task.cancel()
+        try:
+            await self._event_task
+        except asyncio.CancelledError:
+            pass
+        self._event_task = None
+        self._event_queue = None
+
+    def apply_webhook_event(self, event_payload):
+        """Merge an incoming webhook event into the cached device state.
+
+        Returns True if the event matched a known device, so callers can
+        fall back to a full update() otherwise.
+        """
+        event = event_payload.get("event", event_payload)
+        device = self._device_state.get(event.get("device_id"))
+        if device is None:
+            return False
+        if "created_at" in event:
+            device["last_heard_from_at"] = event["created_at"]
+            self._last_heard[device["device_id"]] = event["created_at"]
+        event_type = event.get("type")
+        if event_type == "device_offline":
+            device["offline"] = True
+        elif event_type == "device_online":
+            device["offline"] = False
+        category = EVENT_TO_CATEGORY.get(event_type)
+        if category:
+            on_event = EVENTS[category][0]
+            ongoing = device.setdefault("ongoing_events", [])
+            if event_type == on_event:
+                if event_type not in ongoing:
+                    ongoing.append(event_type)
+            elif on_event in ongoing:
+                ongoing.remove(on_event)
+        self._state_version += 1
+        return True
+
+    async def _update(self):
+        """Fetch devices and homes concurrently and refresh the session state."""
+        devices, homes = await asyncio.gather(
+            self._request_devices(MINUT_DEVICES_URL, "devices"),
+            self._request_devices(MINUT_HOMES_URL, "homes"),
+            return_exceptions=True,
+        )
+        if isinstance(devices, BaseException):
+            raise devices
+
+        if devices:
+            state = self._device_state
+            new_state = {}
+            changed = False
+            for device in devices:
+                device_id = device["device_id"]
+                old = state.get(device_id)
+                if old == device:
+                    new_state[device_id] = old
+                else:
+                    new_state[device_id] = device
+                    changed = True
+            for device_id in state:
+                if device_id not in new_state:
+                    self._devices.pop(device_id, None)
+                    changed = True
+            # Single reference rebind publishes the new state atomically
+            # to lock-free readers.
+            self._device_state = new_state
+            if changed:
+                self._state_version += 1
+                # A fresh latest_sensor_values supersedes single reads.
+                self._sensor_cache.clear()
+                self._battery, self._last_heard, self._descriptions = {}, {}, {}
+                for device in new_state.values():
+                    self._index_device(device)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "Found devices: %s",
                     [
-                        {k: self._device_state[k]["description"]}
-                        for k in self._device_state
+                        {device_id: device["description"]}
+                        for device_id, device in self._device_state.items()
                     ],
                 )
-                homes = await self._request_devices(MINUT_HOMES_URL, "homes")
-                if homes:
-                    self._homes = homes
-                    _LOGGER.debug(
-                        "Found homes: %s",
-                        [{home["home_id"]: home["name"]} for home in self._homes],
-                    )
-            return devices
+        self._apply_homes(homes)
+        return devices
+
+    def _apply_homes(self, homes):
+        """Store fetched homes and rebuild the filtered view."""
+        if isinstance(homes, BaseException):
+            _LOGGER.error("Failed to fetch homes: %s", homes)
+        elif homes:
+            self._homes = homes
+            self._homes_filtered = {
+                home["home_id"]: home for home in homes if "alarm_status" in home
+            }
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Found homes: %s",
+                    [{home["home_id"]: home["name"]} for home in self._homes],
+                )
 
     @property
     def homes(self):
         """Return all known homes."""
-        return {
-            home["home_id"]: home
-            for home in self._homes
-            if "alarm_status" in home.keys()
-        }
+        return self._homes_filtered
 
     async def _set_alarm(self, status, home_id):
         """Set alarm satus."""
         response = await self.auth.request(
-            f"{MINUT_HOMES_URL}/{home_id}",
+            home_url(home_id),
             request_type="PUT",
             json={"alarm_status": status},
         )
@@ -164,29 +459,46 @@ class PointSession:  # pylint: disable=too-many-instance-attributes
 
     def device(self, device_id):
         """Return a device object."""
-        if len(device_id) == 1:
-            raise Exception("ERR FER")  # pylint: disable=broad-exception-raised
-        return Device(self, device_id)
+        device = self._devices.get(device_id)
+        if device is None:
+            device = self._devices[device_id] = Device(self, device_id)
+        return device
 
     @property
     def device_ids(self):
         """List of known device ids."""
-        with self._lock:
-            return self._device_state.keys()
+        if (
+            self._device_ids_view is None
+            or self._device_ids_view[0] != self._state_version
+        ):
+            self._device_ids_view = (self._state_version, tuple(self._device_state))
+        return self._device_ids_view[1]
 
     def device_raw(self, device_id):
         """Return the raw representaion of a device."""
-        with self._lock:
-            return self._device_state.get(device_id)
+        return self._device_state.get(device_id)
 
 
 class Device:
     """Point device."""
 
+    __slots__ = (
+        "_session",
+        "_device_id",
+        "_cached_version",
+        "_cached_raw",
+        "_info_version",
+        "_cached_info",
+    )
+
     def __init__(self, session, device_id):
         """Initialize the Minut Point Device object."""
         self._session = session
         self._device_id = device_id
+        self._cached_version = -1
+        self._cached_raw = None
+        self._info_version = -1
+        self._cached_info = None
 
     def __str__(self):
         """Representaion of device."""
@@ -197,10 +509,31 @@ class Device:
         _LOGGER.debug("Reading %s sensor.", sensor_type)
         return await self._session.read_sensor(self.device_id, sensor_type)
 
+    async def sensors(self, sensor_types):
+        """Update and return several sensor values concurrently."""
+        return await self._session.read_sensors(
+            [(self.device_id, sensor_type) for sensor_type in sensor_types]
+        )
+
     @property
     def device(self):
-        """Return the raw representation of the device."""
-        return self._session.device_raw(self.device_id)
+        """Return the raw representation of the device.
+
+        The dict is cached until the session state changes, so reading
+        several properties costs a single lookup per update cycle.
+        """
+        version = self._session._state_version  # pylint: disable=protected-access
+        if self._cached_version != version:
+            self._cached_raw = self._session.device_raw(self.device_id)
+            self._cached_version = version
+        return self._cached_raw
+
+    def refresh(self):
+        """Drop the cached raw dict so the next access re-reads it."""
+        self._cached_version = -1
+        self._cached_raw = None
+        self._info_version = -1
+        self._cached_info = None
 
     @property
     def ongoing_events(self):
@@ -215,38 +548,43 @@ class Device:
     @property
     def last_update(self):
         """Last update from device."""
-        return self.device["last_heard_from_at"]
+        return self._session.last_heard(self.device_id)
 
     @property
     def name(self):
         """Name of device."""
-        return self.device.get("description")
+        return self._session.description(self.device_id)
 
     @property
     def battery_level(self):
         """Battery level of device."""
-        return self.device["battery"]["percent"]
+        return self._session.battery_level(self.device_id)
 
     @property
     def device_info(self):
-        """Info about device."""
-        return {
-            "connections": {("mac", self.device["device_mac"])},
-            "identifieres": self.device["device_id"],
-            "manufacturer": "Minut",
-            "model": f"Point v{self.device['hardware_version']}",
-            "name": self.device["description"],
-            "sw_version": self.device["firmware"]["installed"],
-        }
+        """Info about device, cached until the session state changes."""
+        device = self.device
+        if self._info_version != self._cached_version:
+            self._cached_info = {
+                "connections": {("mac", device["device_mac"])},
+                "identifieres": device["device_id"],
+                "manufacturer": "Minut",
+                "model": f"Point v{device['hardware_version']}",
+                "name": device["description"],
+                "sw_version": device["firmware"]["installed"],
+            }
+            self._info_version = self._cached_version
+        return self._cached_info
 
     @property
     def device_status(self):
         """Status of device."""
+        device = self.device
         return {
-            "active": self.device["active"],
-            "offline": self.device["offline"],
-            "last_update": self.last_update,
-            "battery_level": self.battery_level,
+            "active": device["active"],
+            "offline": device["offline"],
+            "last_update": device["last_heard_from_at"],
+            "battery_level": device["battery"]["percent"],
         }
 
     @property
@@ -1,55 +1,196 @@
 """Abstract class to make authenticated requests."""
 
 from abc import ABC, abstractmethod
+import asyncio
+import json
 import logging
+from time import monotonic
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
 from aiohttp.client_exceptions import ClientConnectionError
 
 from .const import TIMEOUT
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+_CLIENT_TIMEOUT = ClientTimeout(
+    total=TIMEOUT.seconds, connect=3, sock_read=TIMEOUT.seconds
+)
+
+# How long a fetched access token is reused before asking the subclass
+# again; well below any real token lifetime but enough to cover a burst.
+_TOKEN_REUSE_SECONDS = 30.0
+
 
 class AbstractAuth(ABC):
-    """Abstract class to make authenticated requests."""
+    """Abstract class to make authenticated requests.
+
+    The session is kept for the lifetime of the auth object so that
+    connections to the Minut API stay pooled and TLS handshakes are
+    amortized across requests.
+    """
 
-    def __init__(self, websession: ClientSession):
-        """Initialize the auth."""
+    def __init__(
+        self,
+        websession: ClientSession | None = None,
+        connector: TCPConnector | None = None,
+    ):
+        """Initialize the auth, creating a pooled session if none is given."""
+        self._owns_session = websession is None
+        if websession is None:
+            websession = ClientSession(
+                connector=connector
+                or TCPConnector(
+                    limit_per_host=8,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                json_serialize=_dumps,
+            )
         self.websession = websession
+        self._auth_headers = None
+        self._token = None
+        self._token_time = 0.0
+        self._token_lock = asyncio.Lock()
+
+    async def aclose(self):
+        """Close the websession, if this object created it."""
+        if self._owns_session:
+            await self.websession.close()
 
     @abstractmethod
     async def async_get_access_token(self) -> str:
         """Return a valid access token."""
 
-    async def request(self, url, request_type="GET", **kwargs) -> ClientResponse:
-        """Send a request to the Minut Point API."""
-        headers = kwargs.get("headers")
+    async def _get_access_token(self) -> str:
+        """Return the access token, reusing a recent one across bursts.
 
+        Concurrent refreshes are de-duplicated behind a lock so a
+        fan-out of requests triggers a single token fetch.
+        """
+        if self._token is not None and (
+            monotonic() - self._token_time < _TOKEN_REUSE_SECONDS
+        ):
+            return self._token
+        async with self._token_lock:
+            if self._token is None or (
+                monotonic() - self._token_time >= _TOKEN_REUSE_SECONDS
+            ):
+                self._token = await self.async_get_access_token()
+                self._token_time = monotonic()
+            return self._token
+
+    async def _raw_request(self, url, request_type="GET", **kwargs) -> ClientResponse:
+        """Send an authenticated request and return the raw response."""
+        headers = kwargs.pop("headers", None)
+
+        access_token = await self._get_access_token()
+        if self._auth_headers is None or self._auth_headers[0] != access_token:
+            self._auth_headers = (
+                access_token,
+                {"authorization": f"Bearer {access_token}"},
+            )
         if headers is None:
-            headers = {}
+            headers = self._auth_headers[1]
         else:
-            headers = dict(headers)
-
-        access_token = await self.async_get_access_token()
-        headers["authorization"] = f"Bearer {access_token}"
+            headers = {**headers, **self._auth_headers[1]}
 
-        try:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Request %s %s %s", url, kwargs, headers)
-            response = await self.websession.request(
-                request_type, url, **kwargs, timeout=TIMEOUT.seconds, headers=headers
-            )
+        response = await self.websession.request(
+            request_type, url, **kwargs, timeout=_CLIENT_TIMEOUT, headers=headers
+        )
+        if response.status >= 400:
+            if response.status == 401:
+                # Token rejected; drop it so the next call asks the
+                # subclass for a fresh one instead of waiting out the
+                # reuse window.
+                self._token = None
+            _LOGGER.error("Error %s for url: %s", response.status, url)
             response.raise_for_status()
-            resp = await response.json()
-            _LOGGER.log(
-                logging.NOTSET,
-                "Response %s %s %s",
-                response.status,
-                response.headers["content-type"],
-                resp.get("values")[-1]
-                if kwargs.get("data") and resp.get("values")
-                else response.text,
+        return response
+
+    async def request_items(
+        self, url, items_key, request_type="GET", etag=None, **kwargs
+    ):
+        """Request a list of items, stream-parsed when ijson is available.
+
+        Streaming avoids holding both the raw bytes and the full parsed
+        tree in memory for large device lists. Returns (items, etag);
+        items is None when the server replies 304 Not Modified to the
+        given etag.
+        """
+        if etag is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "If-None-Match": etag,
+            }
+        if ijson is None:
+            res, status, headers = await self.request_with_headers(
+                url, request_type, **kwargs
             )
+            if status == 304:
+                return None, etag
+            items = res.get(items_key) if res else {}
+            return items, headers.get("etag") if headers else None
+        try:
+            response = await self._raw_request(url, request_type, **kwargs)
+            if response.status == 304:
+                return None, etag
+            items = [
+                item
+                async for item in ijson.items(response.content, f"{items_key}.item")
+            ]
+            return items, response.headers.get("etag")
+        except ClientConnectionError as error:
+            _LOGGER.error("Client issue: %s", error)
+            return {}, None
+
+    async def request_with_headers(self, url, request_type="GET", **kwargs):
+        """Send a request and return (parsed body, status, headers).
+
+        A 304 Not Modified response is returned unparsed so callers can
+        reuse their cached body.
+        """
+        try:
+            response = await self._raw_request(url, request_type, **kwargs)
+            if response.status == 304:
+                return None, response.status, response.headers
+            return _loads(await response.read()), response.status, response.headers
+        except ClientConnectionError as error:
+            _LOGGER.error("Client issue: %s", error)
+            return None, None, None
+
+    async def request(self, url, request_type="GET", **kwargs) -> ClientResponse:
+        """Send a request to the Minut Point API."""
+        try:
+            response = await self._raw_request(url, request_type, **kwargs)
+            resp = _loads(await response.read())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Response %s %s",
+                    response.status,
+                    resp.get("values")[-1]
+                    if kwargs.get("data") and resp.get("values")
+                    else resp,
+                )
             if "error" in resp:
                 _LOGGER.error("Error for url: %s, %s", url, resp["error"])
             return resp
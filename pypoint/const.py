@@ -1,6 +1,8 @@
 """Constants for Minut Point."""
 
 from datetime import timedelta
+import sys
+from types import MappingProxyType
 
 MINUT_API_URL = "https://api.minut.com/v8/"
 MINUT_AUTH_URL = MINUT_API_URL + "oauth/authorize"
@@ -10,58 +12,91 @@ MINUT_TOKEN_URL = MINUT_API_URL + "oauth/token"
 MINUT_WEBHOOKS_URL = MINUT_API_URL + "webhooks"
 MINUT_HOMES_URL = MINUT_API_URL + "homes"
 
+
+def device_url(device_id):
+    """Return the URL for a device."""
+    return f"{MINUT_DEVICES_URL}/{device_id}"
+
+
+def device_sensor_url(device_id, sensor_uri):
+    """Return the sensor readings URL for a device."""
+    return f"{MINUT_DEVICES_URL}/{device_id}/{sensor_uri}"
+
+
+def hook_url(hook_id):
+    """Return the URL for a registered webhook."""
+    return f"{MINUT_WEBHOOKS_URL}/{hook_id}"
+
+
+def home_url(home_id):
+    """Return the URL for a home."""
+    return f"{MINUT_HOMES_URL}/{home_id}"
+
+
+# Interned keys and values make the per-read lookup a pointer-equal hash hit.
 MAP_SENSORS = {
-    "sound_pressure": "sound",
+    sys.intern(key): sys.intern(value)
+    for key, value in {
+        "sound_pressure": "sound",
+    }.items()
 }
 
 TIMEOUT = timedelta(seconds=10)
 
-EVENTS = {
-    "alarm": (  # On means alarm sound was recognised, Off means normal
-        "alarm_heard",
-        "alarm_silenced",
-    ),
-    "battery": ("battery_low", ""),  # On means low, Off means normal
-    "button_press": (  # On means the button was pressed, Off means normal
-        "short_button_press",
-        "",
-    ),
-    "cold": (  # On means cold, Off means normal
-        "temperature_low",
-        "temperature_risen_normal",
-    ),
-    "connectivity": (  # On means connected, Off means disconnected
-        "device_online",
-        "device_offline",
-    ),
-    "dry": (  # On means too dry, Off means normal
-        "humidity_low",
-        "humidity_risen_normal",
-    ),
-    "glass": ("glassbreak", ""),  # The sound of glass break was detected
-    "heat": (  # On means hot, Off means normal
-        "temperature_high",
-        "temperature_dropped_normal",
-    ),
-    "moisture": (  # On means wet, Off means dry
-        "humidity_high",
-        "humidity_dropped_normal",
-    ),
-    "motion": (  # On means motion detected, Off means no motion (clear)
-        "pir_motion",
-        "",
-    ),
-    "noise": (
-        "disturbance_first_notice",  # The first alert of the noise monitoring
-        "disturbance_ended",  # Created when the noise levels have gone back to normal
-    ),
-    "sound": (  # On means sound detected, Off means no sound (clear)
-        "avg_sound_high",
-        "sound_level_dropped_normal",
-    ),
-    "tamper_old": ("tamper", ""),  # On means the point was removed or attached
-    "tamper": (
-        "tamper_removed",  # Minut was mounted on the mounting plate (newer devices only)
-        "tamper_mounted",  # Minute was removed from the mounting plate (newer devices only)
-    ),
+EVENTS = MappingProxyType(
+    {
+        "alarm": (  # On means alarm sound was recognised, Off means normal
+            "alarm_heard",
+            "alarm_silenced",
+        ),
+        "battery": ("battery_low", ""),  # On means low, Off means normal
+        "button_press": (  # On means the button was pressed, Off means normal
+            "short_button_press",
+            "",
+        ),
+        "cold": (  # On means cold, Off means normal
+            "temperature_low",
+            "temperature_risen_normal",
+        ),
+        "connectivity": (  # On means connected, Off means disconnected
+            "device_online",
+            "device_offline",
+        ),
+        "dry": (  # On means too dry, Off means normal
+            "humidity_low",
+            "humidity_risen_normal",
+        ),
+        "glass": ("glassbreak", ""),  # The sound of glass break was detected
+        "heat": (  # On means hot, Off means normal
+            "temperature_high",
+            "temperature_dropped_normal",
+        ),
+        "moisture": (  # On means wet, Off means dry
+            "humidity_high",
+            "humidity_dropped_normal",
+        ),
+        "motion": (  # On means motion detected, Off means no motion (clear)
+            "pir_motion",
+            "",
+        ),
+        "noise": (
+            "disturbance_first_notice",  # The first alert of the noise monitoring
+            "disturbance_ended",  # Created when the noise levels have gone back to normal
+        ),
+        "sound": (  # On means sound detected, Off means no sound (clear)
+            "avg_sound_high",
+            "sound_level_dropped_normal",
+        ),
+        "tamper_old": ("tamper", ""),  # On means the point was removed or attached
+        "tamper": (
+            "tamper_removed",  # Minut was mounted on the mounting plate (newer devices only)
+            "tamper_mounted",  # Minute was removed from the mounting plate (newer devices only)
+        ),
+    }
+)
+
+ALL_EVENTS = tuple(e for v in EVENTS.values() for e in v if e)
+
+EVENT_TO_CATEGORY = {
+    event: category for category, events in EVENTS.items() for event in events if event
 }